@@ -1,11 +1,35 @@
+import asyncio
+import hashlib
+import re
 import sys
-from openai import OpenAI
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from openai import OpenAI, AsyncOpenAI
 from qiita_db.study import Study, StudyPerson
 from qiita_db.sql_connection import TRN
+import numpy as np
 import pandas as pd
 import json
 from dotenv import load_dotenv
 import os
+
+# Optional dependency: used to embed queries for the semantic cache. When it
+# is not installed the cache is simply disabled and every query goes to the
+# LLM, exactly as before.
+try:
+    from sentence_transformers import SentenceTransformer
+except ImportError:
+    SentenceTransformer = None
+
+# Optional dependency: persists the exact-match query cache across
+# processes; without it the cache is in-memory only.
+try:
+    from diskcache import Cache as DiskCache
+except ImportError:
+    DiskCache = None
+
+from where_validator import validate_where
+
 load_dotenv()
 API_KEY = os.getenv("API_KEY")
 
@@ -16,58 +40,297 @@ client = OpenAI(
     base_url = "https://ellm.nrp-nautilus.io/v1"
 )
 
-def search_studies_with_sql(custom_sql_where="", params=None):
+# Async client used by batch_smart_search to overlap the network I/O of
+# several NL -> SQL translations
+async_client = AsyncOpenAI(
+    api_key = API_KEY,
+    base_url = "https://ellm.nrp-nautilus.io/v1"
+)
+
+class SemanticQueryCache:
+    """Embedding-based cache of natural language -> SQL translations
+
+    Semantically identical queries ("find soil studies" vs "studies about
+    soil") produce the same WHERE clause, so instead of paying the LLM
+    round trip every time we embed each query and reuse the stored
+    translation of the nearest cached query when the cosine similarity
+    is above a threshold. Vectors and results are persisted to disk so
+    the cache survives restarts.
+
+    Parameters
+    ----------
+    cache_dir : str, optional
+        Directory where the vectors and translations are persisted.
+        Defaults to ``.semantic_cache`` next to this module.
+    threshold : float, optional
+        Minimum cosine similarity between a new query and a cached one
+        for the cached translation to be reused
+    """
+
+    _model_name = "sentence-transformers/all-MiniLM-L6-v2"
+
+    def __init__(self, cache_dir=None, threshold=0.92):
+        self.threshold = threshold
+        self.cache_dir = cache_dir or os.path.join(
+            os.path.dirname(os.path.abspath(__file__)), ".semantic_cache")
+        self._model = None
+        # (N, dim) float32 matrix of L2-normalized query embeddings; with
+        # normalized vectors the inner product is the cosine similarity
+        self._vectors = None
+        self._results = []
+        self._load()
+
+    @property
+    def enabled(self):
+        return SentenceTransformer is not None
+
+    def _embed(self, text):
+        if self._model is None:
+            self._model = SentenceTransformer(self._model_name)
+        vec = self._model.encode(text).astype(np.float32)
+        return vec / np.linalg.norm(vec)
+
+    def get(self, user_query):
+        """Return the cached translation for a semantically similar query
+
+        Parameters
+        ----------
+        user_query : str
+            Natural language query
+
+        Returns
+        -------
+        dict or None
+            The cached ``{'where_clause': ..., 'params': ...}`` dict, or
+            None if no cached query is similar enough
+        """
+        if not self.enabled or self._vectors is None:
+            return None
+        vec = self._embed(user_query)
+        sims = self._vectors @ vec
+        best = int(np.argmax(sims))
+        if sims[best] > self.threshold:
+            return self._results[best]
+        return None
+
+    def add(self, user_query, result):
+        """Store the translation of a query and persist the cache to disk
+
+        Parameters
+        ----------
+        user_query : str
+            Natural language query
+        result : dict
+            The ``{'where_clause': ..., 'params': ...}`` translation
+        """
+        if not self.enabled:
+            return
+        vec = self._embed(user_query)[np.newaxis, :]
+        if self._vectors is None:
+            self._vectors = vec
+        else:
+            self._vectors = np.vstack([self._vectors, vec])
+        self._results.append(result)
+        self._save()
+
+    def _load(self):
+        vec_fp = os.path.join(self.cache_dir, "vectors.npy")
+        res_fp = os.path.join(self.cache_dir, "results.json")
+        if os.path.exists(vec_fp) and os.path.exists(res_fp):
+            self._vectors = np.load(vec_fp)
+            with open(res_fp) as f:
+                self._results = json.load(f)
+
+    def _save(self):
+        os.makedirs(self.cache_dir, exist_ok=True)
+        np.save(os.path.join(self.cache_dir, "vectors.npy"), self._vectors)
+        with open(os.path.join(self.cache_dir, "results.json"), "w") as f:
+            json.dump(self._results, f)
+
+
+_SEMANTIC_CACHE = SemanticQueryCache()
+
+
+STUDY_COLUMNS = ('study_id', 'study_title', 'study_abstract',
+                 'pi_name', 'pi_email', 'pi_affiliation', 'lab_person_name')
+StudyRow = namedtuple('StudyRow', STUDY_COLUMNS)
+
+# The artifact/visibility join chain multiplies rows and costs the
+# planner hash/merge work, but no SELECT column comes from it; it is
+# appended only when the WHERE clause actually references those aliases
+_VISIBILITY_JOIN = """
+            LEFT JOIN qiita.study_artifact sa ON s.study_id = sa.study_id
+            LEFT JOIN qiita.artifact a ON sa.artifact_id = a.artifact_id
+            LEFT JOIN qiita.visibility v ON a.visibility_id = v.visibility_id"""
+
+_VISIBILITY_ALIASES = re.compile(r'\b(?:sa|a|v)\.')
+
+
+def _join_clause(where):
+    """Joins needed beyond the study_person ones the SELECT always uses"""
+    return _VISIBILITY_JOIN if _VISIBILITY_ALIASES.search(where) else ""
+
+
+def search_studies_with_sql(custom_sql_where="", params=None, limit=50,
+                            offset=0, abstract_preview=300):
     """
     Search studies using custom SQL WHERE clause
-    
+
     Parameters
     ----------
     custom_sql_where : str
         Custom WHERE clause (without the WHERE keyword)
     params : list
         Parameters for the SQL query
-    
+    limit : int, optional
+        Maximum number of rows to return; bounds memory and network
+        transfer for broad queries
+    offset : int, optional
+        Number of rows to skip, for pagination
+    abstract_preview : int or None, optional
+        Truncate study_abstract to this many characters in the database,
+        skipping the toast-table reads and transfer of full multi-KB
+        abstracts; pass None for the full text
+
     Returns
     -------
-    pd.DataFrame
-        DataFrame with study information
+    list of StudyRow
+        Matching studies as lightweight namedtuples; use to_df for a
+        pandas DataFrame
     """
     if params is None:
         params = []
-    
+
+    if custom_sql_where and not validate_where(custom_sql_where):
+        raise ValueError(f"Unsafe WHERE clause: {custom_sql_where!r}")
+
+    where = custom_sql_where if custom_sql_where else '1=1'
+    if abstract_preview is not None:
+        select_abstract = "LEFT(s.study_abstract, %s) as study_abstract"
+        sql_params = [abstract_preview] + list(params)
+    else:
+        select_abstract = "s.study_abstract"
+        sql_params = list(params)
+    sql_params += [limit, offset]
+
     with TRN:
+        # Cap pathological plans instead of letting them hold the
+        # connection; SET LOCAL scopes it to this transaction
+        TRN.add("SET LOCAL statement_timeout = '2s'")
         sql = f"""
-        SELECT DISTINCT s.study_id, s.study_title, s.study_abstract,
-               sp_pi.name as pi_name, sp_pi.email as pi_email, 
+        SELECT DISTINCT s.study_id, s.study_title, {select_abstract},
+               sp_pi.name as pi_name, sp_pi.email as pi_email,
                sp_pi.affiliation as pi_affiliation,
                sp_lab.name as lab_person_name
         FROM qiita.study s
-        LEFT JOIN qiita.study_person sp_pi 
+        LEFT JOIN qiita.study_person sp_pi
             ON s.principal_investigator_id = sp_pi.study_person_id
-        LEFT JOIN qiita.study_person sp_lab 
-            ON s.lab_person_id = sp_lab.study_person_id
-        LEFT JOIN qiita.study_artifact sa ON s.study_id = sa.study_id
-        LEFT JOIN qiita.artifact a ON sa.artifact_id = a.artifact_id
-        LEFT JOIN qiita.visibility v ON a.visibility_id = v.visibility_id
-        WHERE {custom_sql_where if custom_sql_where else '1=1'}
+        LEFT JOIN qiita.study_person sp_lab
+            ON s.lab_person_id = sp_lab.study_person_id{_join_clause(where)}
+        WHERE {where}
         ORDER BY s.study_id
+        LIMIT %s OFFSET %s
         """
-        
-        TRN.add(sql, params)
+
+        TRN.add(sql, sql_params)
         results = TRN.execute_fetchindex()
-    
-    if not results:
-        return pd.DataFrame()
-    
-    df = pd.DataFrame(results, columns=[
-        'study_id', 'study_title', 'study_abstract', 
-        'pi_name', 'pi_email', 'pi_affiliation', 'lab_person_name'
-    ])
-    
-    return df
+
+    return [StudyRow._make(r) for r in results]
+
+
+def to_df(rows):
+    """
+    Build a pandas DataFrame from search_studies_with_sql results
+
+    Parameters
+    ----------
+    rows : list of StudyRow
+        Rows returned by search_studies_with_sql
+
+    Returns
+    -------
+    pd.DataFrame
+        DataFrame with study information
+    """
+    if not rows:
+        return pd.DataFrame(columns=STUDY_COLUMNS)
+
+    # Transpose to columnar arrays first (AoS -> SoA) so pandas adopts
+    # whole columns directly instead of inferring types row by row
+    cols = zip(*rows)
+    return pd.DataFrame(dict(zip(STUDY_COLUMNS, cols)), copy=False)
+
+_DISK_CACHE = DiskCache(os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), ".exact_cache")) \
+    if DiskCache is not None else None
+
+
+def _disk_cache_get(user_query):
+    if _DISK_CACHE is None:
+        return None
+    key = hashlib.blake2b(user_query.encode()).hexdigest()
+    return _DISK_CACHE.get(key)
+
+
+def _disk_cache_set(user_query, result):
+    if _DISK_CACHE is not None:
+        key = hashlib.blake2b(user_query.encode()).hexdigest()
+        _DISK_CACHE.set(key, result)
+
 
 def llm_query_to_sql(user_query):
-    system_prompt = """You are a SQL query generator for a microbiome study database (Qiita).
+    """Translate a natural language query into a SQL WHERE clause
+
+    Thin wrapper that normalizes the query so that identical strings
+    ("Find soil studies" vs "find soil studies ") hit an exact O(1)
+    cache before any embedding or LLM work happens.
+
+    Parameters
+    ----------
+    user_query : str
+        Natural language query
+
+    Returns
+    -------
+    dict
+        ``{'where_clause': ..., 'params': ...}``
+    """
+    return _llm_query_to_sql_cached(user_query.strip().lower())
+
+
+# In-memory exact cache of normalized query -> translation. A plain dict
+# instead of functools.lru_cache so that fallback translations can be
+# kept out of it (see _llm_query_to_sql_cached)
+_EXACT_CACHE = {}
+_EXACT_CACHE_MAXSIZE = 1024
+
+
+def _llm_query_to_sql_cached(user_query):
+    hit = _EXACT_CACHE.get(user_query)
+    if hit is None:
+        # Second cache level: the on-disk exact cache survives restarts
+        hit = _disk_cache_get(user_query)
+    if hit is not None:
+        return hit
+
+    result, cacheable = _llm_query_to_sql(user_query)
+
+    # Only store translations that came from a parsed, validated LLM
+    # response (or a deterministic fast path); caching the keyword
+    # fallback would pin a transient LLM outage as the permanent
+    # translation for this query
+    if cacheable:
+        if len(_EXACT_CACHE) >= _EXACT_CACHE_MAXSIZE:
+            _EXACT_CACHE.clear()
+        _EXACT_CACHE[user_query] = result
+        _disk_cache_set(user_query, result)
+    return result
+
+
+# Shared by the sync and async translation paths; the prebuilt message
+# dict below means every call sends a byte-identical system prefix,
+# which also lets the server reuse its KV cache for it
+_SYSTEM_PROMPT = """You are a SQL query generator for a microbiome study database (Qiita).
 
 Available tables and columns:
 - s.study_id (integer)
@@ -81,54 +344,265 @@ Available tables and columns:
 
 Your task:
 1. Convert the user's natural language query into a PostgreSQL WHERE clause
-2. Use ILIKE for case-insensitive text matching (e.g., field ILIKE '%keyword%')
-3. Use parameterized queries with %s placeholders
-4. Return ONLY a JSON object with 'where_clause' and 'params' fields
+2. For topical queries against title/abstract, use full text search:
+   to_tsvector('english', coalesce(s.study_title, '') || ' ' || coalesce(s.study_abstract, '')) @@ plainto_tsquery('english', %s)
+   with the plain keywords (no % wildcards) as the parameter
+3. For case-insensitive matching on name/email/affiliation fields use
+   lower(field) LIKE lower(%s) with '%val%' wildcards for substring matches,
+   or lower(field) = lower(%s) for exact matches (both are indexed;
+   plain ILIKE is not)
+4. Use parameterized queries with %s placeholders
+5. Return ONLY a JSON object with 'where_clause' and 'params' fields
 
 Examples:
 
 User: "Find studies about soil microbiome"
 Response: {
-  "where_clause": "(s.study_title ILIKE %s OR s.study_abstract ILIKE %s)",
-  "params": ["%soil%", "%soil%"]
+  "where_clause": "to_tsvector('english', coalesce(s.study_title, '') || ' ' || coalesce(s.study_abstract, '')) @@ plainto_tsquery('english', %s)",
+  "params": ["soil microbiome"]
 }
 
 User: "Studies by Rob Knight"
 Response: {
-  "where_clause": "sp_pi.name ILIKE %s",
+  "where_clause": "lower(sp_pi.name) LIKE lower(%s)",
   "params": ["%Rob Knight%"]
 }
 
 Return ONLY valid JSON, no other text."""
 
-    message = client.chat.completions.create(
+_SYSTEM_MSG = {"role": "system", "content": _SYSTEM_PROMPT}
+
+
+# Full text search clause for topical queries. Matches the expression of
+# the study_fts_idx GIN index (patch 96.sql), so Postgres answers these
+# with an index lookup plus stemming/ranking instead of the sequential
+# scan that ILIKE '%kw%' forces.
+FTS_WHERE = ("to_tsvector('english', coalesce(s.study_title, '') || ' ' || "
+             "coalesce(s.study_abstract, '')) @@ plainto_tsquery('english', %s)")
+
+# Pre-compiled intent patterns for queries so simple they do not need an
+# LLM at all ("studies by X", "studies about Y"). Each entry maps a regex
+# to a builder that emits the WHERE clause directly, saving the remote
+# call entirely for a large share of real queries.
+PATTERNS = [
+    (re.compile(r'(?:(?:find|show)\s+(?:me\s+)?)?studies?\s+by\s+(?P<name>.+)', re.I),
+     lambda m: {
+         "where_clause": "lower(sp_pi.name) LIKE lower(%s)",
+         "params": [f"%{m['name'].strip()}%"]
+     }),
+    (re.compile(r'(?:(?:find|show)\s+(?:me\s+)?)?studies?\s+(?:about|on)\s+(?P<kw>.+)', re.I),
+     lambda m: {
+         "where_clause": FTS_WHERE,
+         "params": [m['kw'].strip()]
+     }),
+]
+
+
+def _pattern_fast_path(user_query):
+    """Translate trivially structured queries without calling the LLM
+
+    Returns
+    -------
+    dict or None
+        The translation if a pattern matched, None to fall through to
+        the LLM
+    """
+    user_query = user_query.strip()
+    for pattern, build in PATTERNS:
+        m = pattern.fullmatch(user_query)
+        if m is not None:
+            return build(m)
+    return None
+
+
+def _json_complete(buf):
+    """True once the streamed buffer holds a brace-balanced JSON object"""
+    opens = buf.count("{")
+    return opens > 0 and opens == buf.count("}")
+
+
+def _parse_llm_response(response_text):
+    """Parse and validate the model's strict-JSON response
+
+    response_format=json_object guarantees a fence-free JSON body, so no
+    markdown stripping is needed; the only check left is that the payload
+    has the expected shape.
+
+    Raises
+    ------
+    ValueError
+        If the response is not valid JSON or lacks the expected fields
+        (json.JSONDecodeError is a ValueError)
+    """
+    result = json.loads(response_text)
+    if not isinstance(result, dict) \
+            or not isinstance(result.get("where_clause"), str) \
+            or not isinstance(result.get("params"), list):
+        raise ValueError(f"Malformed translation: {result!r}")
+    return result
+
+
+def _keyword_fallback(user_query):
+    """Heuristic translation used when the LLM response is unusable"""
+    keywords = user_query.lower().replace("find", "").replace("studies", "").replace("about", "").strip()
+    return {
+        "where_clause": FTS_WHERE,
+        "params": [keywords]
+    }
+
+
+def _llm_query_to_sql(user_query):
+    """Translate a normalized query, reporting whether to cache the result
+
+    Returns
+    -------
+    dict, bool
+        The translation and whether it is worth caching; the keyword
+        fallback produced after a failed or rejected LLM response is not
+    """
+    # Cheapest route first: simple intents are translated by regex alone
+    fast = _pattern_fast_path(user_query)
+    if fast is not None:
+        return fast, True
+
+    # Reuse the translation of a semantically similar query if we have one;
+    # a cache hit skips the network + GPU inference round trip entirely
+    cached = _SEMANTIC_CACHE.get(user_query)
+    if cached is not None:
+        return cached, True
+
+    # The expected payload is <100 tokens of JSON: cap the decode budget,
+    # pin temperature for determinism, ask for strict JSON and stream so
+    # parsing can start as soon as the closing brace arrives
+    stream = client.chat.completions.create(
         model="gemma3",
-        messages=[
-            {"role": "system", "content": system_prompt},
-            {"role": "user", "content": user_query}
-        ]
+        messages=[_SYSTEM_MSG, {"role": "user", "content": user_query}],
+        max_tokens=150,
+        temperature=0,
+        response_format={"type": "json_object"},
+        stream=True
     )
 
-    response_text = message.choices[0].message.content.strip()
-    
-    # Remove markdown code blocks if present
-    if response_text.startswith("```"):
-        response_text = response_text.split("```")[1]
-        if response_text.startswith("json"):
-            response_text = response_text[4:]
-        response_text = response_text.strip()
-    
+    buf = ""
+    for chunk in stream:
+        if chunk.choices:
+            buf += chunk.choices[0].delta.content or ""
+        if _json_complete(buf):
+            break
+    # breaking out early abandons the HTTP response; release the
+    # connection instead of leaving it to the GC
+    stream.close()
+    response_text = buf.strip()
+
+    try:
+        result = _parse_llm_response(response_text)
+    except ValueError:
+        print(f"Warning: Could not parse LLM response: {response_text}")
+        return _keyword_fallback(user_query), False
+
+    if not validate_where(result["where_clause"]):
+        print(f"Warning: Rejected unsafe WHERE clause: {result['where_clause']}")
+        return _keyword_fallback(user_query), False
+
+    _SEMANTIC_CACHE.add(user_query, result)
+    return result, True
+
+
+async def llm_query_to_sql_async(user_query):
+    """Async counterpart of llm_query_to_sql
+
+    Awaits the chat completion instead of blocking on it, so several
+    translations can be in flight at once. Shares the on-disk exact
+    cache and the semantic cache with the sync path.
+
+    Parameters
+    ----------
+    user_query : str
+        Natural language query
+
+    Returns
+    -------
+    dict
+        ``{'where_clause': ..., 'params': ...}``
+    """
+    user_query = user_query.strip().lower()
+
+    fast = _pattern_fast_path(user_query)
+    if fast is not None:
+        return fast
+
+    hit = _disk_cache_get(user_query)
+    if hit is not None:
+        return hit
+    cached = _SEMANTIC_CACHE.get(user_query)
+    if cached is not None:
+        return cached
+
+    stream = await async_client.chat.completions.create(
+        model="gemma3",
+        messages=[_SYSTEM_MSG, {"role": "user", "content": user_query}],
+        max_tokens=150,
+        temperature=0,
+        response_format={"type": "json_object"},
+        stream=True
+    )
+
+    buf = ""
+    async for chunk in stream:
+        if chunk.choices:
+            buf += chunk.choices[0].delta.content or ""
+        if _json_complete(buf):
+            break
+    # as in the sync path, don't leak the connection on an early break
+    await stream.close()
+    response_text = buf.strip()
+
     try:
-        result = json.loads(response_text)
-        return result
-    except json.JSONDecodeError:
+        result = _parse_llm_response(response_text)
+    except ValueError:
         print(f"Warning: Could not parse LLM response: {response_text}")
-        # Extract keywords from query
-        keywords = user_query.lower().replace("find", "").replace("studies", "").replace("about", "").strip()
-        return {
-            "where_clause": "(s.study_title ILIKE %s OR s.study_abstract ILIKE %s)",
-            "params": [f"%{keywords}%", f"%{keywords}%"]
-        }
+        return _keyword_fallback(user_query)
+
+    if not validate_where(result["where_clause"]):
+        print(f"Warning: Rejected unsafe WHERE clause: {result['where_clause']}")
+        return _keyword_fallback(user_query)
+
+    _SEMANTIC_CACHE.add(user_query, result)
+    _disk_cache_set(user_query, result)
+    return result
+
+
+async def batch_smart_search(queries, max_concurrency=5):
+    """Search studies for a batch of natural language queries concurrently
+
+    The NL -> SQL translations overlap their network I/O, so N queries
+    take roughly the latency of the slowest one instead of the sum of
+    all of them. Run from sync code with ``asyncio.run``.
+
+    Parameters
+    ----------
+    queries : list of str
+        Natural language queries
+    max_concurrency : int, optional
+        Maximum number of LLM calls in flight at once
+
+    Returns
+    -------
+    list of list of StudyRow
+        The matching studies for each query, in input order
+    """
+    sem = asyncio.Semaphore(max_concurrency)
+
+    async def controlled(user_query):
+        async with sem:
+            sql_query = await llm_query_to_sql_async(user_query)
+        return search_studies_with_sql(
+            custom_sql_where=sql_query['where_clause'],
+            params=sql_query['params']
+        )
+
+    tasks = [controlled(q) for q in queries]
+    return await asyncio.gather(*tasks)
 
 
 def smart_search_studies(user_query):
@@ -146,21 +620,42 @@ def smart_search_studies(user_query):
         DataFrame with matching studies
     """
     print(f"Processing query: '{user_query}'")
-    
-    # Convert to SQL using LLM
-    sql_query = llm_query_to_sql(user_query)
-    
-    print("Generated SQL query:", sql_query)
-    print(f"Generated WHERE clause: {sql_query['where_clause']}")
-    print(f"Parameters: {sql_query['params']}")
-    
-    # Execute search
-    results = search_studies_with_sql(
-        custom_sql_where=sql_query['where_clause'],
-        params=sql_query['params']
-    )
-    
-    return results
+
+    # Speculative pre-fetch: run the cheap keyword translation against
+    # the database while the LLM works. When the LLM lands on the same
+    # clause the rows are already fetched and the LLM latency was hidden
+    # behind the SQL; otherwise the speculative rows are discarded and
+    # the refined query runs as before.
+    guess = _keyword_fallback(user_query)
+    with ThreadPoolExecutor(2) as pool:
+        llm_future = pool.submit(llm_query_to_sql, user_query)
+        spec_future = pool.submit(
+            search_studies_with_sql,
+            custom_sql_where=guess['where_clause'],
+            params=guess['params']
+        )
+        sql_query = llm_future.result()
+
+        print("Generated SQL query:", sql_query)
+        print(f"Generated WHERE clause: {sql_query['where_clause']}")
+        print(f"Parameters: {sql_query['params']}")
+
+        if sql_query['where_clause'] == guess['where_clause'] \
+                and sql_query['params'] == guess['params']:
+            results = spec_future.result()
+        else:
+            # let the speculative query finish before reusing the shared
+            # TRN connection, then throw its rows away
+            try:
+                spec_future.result()
+            except Exception:
+                pass
+            results = search_studies_with_sql(
+                custom_sql_where=sql_query['where_clause'],
+                params=sql_query['params']
+            )
+
+    return to_df(results)
 
 
 # Example usage:
@@ -174,19 +669,21 @@ if __name__ == "__main__":
         "Find me studies that talk about Sirius Black"
     ]
     
-    for query in queries:
+    # Translate the whole batch concurrently; the per-query LLM latency
+    # overlaps instead of accumulating
+    all_results = asyncio.run(batch_smart_search(queries))
+
+    for query, results in zip(queries, all_results):
         print(f"\n{'=' * 80}")
         print(f"QUERY: {query}")
         print('=' * 80)
-        
-        results = smart_search_studies(query)
-        
-        if not results.empty:
+
+        if results:
             print(f"\nFound {len(results)} studies:\n")
-            for _, row in results.iterrows():
-                print(f"Study {row['study_id']}: {row['study_title']}")
-                print(f"  PI: {row['pi_name']} ({row['pi_affiliation']})")
-                print(f"  Abstract: {row['study_abstract'][:200]}...")
+            for row in results:
+                print(f"Study {row.study_id}: {row.study_title}")
+                print(f"  PI: {row.pi_name} ({row.pi_affiliation})")
+                print(f"  Abstract: {row.study_abstract[:200]}...")
                 print()
         else:
             print("No studies found matching this query")
\ No newline at end of file
@@ -0,0 +1,60 @@
+from unittest import TestCase, main, mock, skipIf
+
+import where_validator
+from where_validator import validate_where
+
+FTS_CLAUSE = ("to_tsvector('english', coalesce(s.study_title, '') || ' ' || "
+              "coalesce(s.study_abstract, '')) @@ "
+              "plainto_tsquery('english', %s)")
+
+
+class ValidateWhereMixin:
+    """Cases both the pglast and the regex-fallback branches must agree on"""
+
+    def test_allowed_clauses(self):
+        self.assertTrue(validate_where("lower(sp_pi.name) LIKE lower(%s)"))
+        self.assertTrue(validate_where("lower(sp_pi.name) = lower(%s)"))
+        self.assertTrue(validate_where(
+            "(s.study_title ILIKE %s OR s.study_abstract ILIKE %s)"))
+        self.assertTrue(validate_where(FTS_CLAUSE))
+        self.assertTrue(validate_where("v.visibility = %s"))
+        self.assertTrue(validate_where("s.study_id = %s"))
+
+    def test_unknown_column_rejected(self):
+        self.assertFalse(validate_where("u.password = %s"))
+        self.assertFalse(validate_where("s.email ILIKE %s"))
+        self.assertFalse(validate_where("sp_lab.email ILIKE %s"))
+
+    def test_subquery_rejected(self):
+        # no ColumnRef at all, but reaches into another table
+        self.assertFalse(validate_where(
+            "EXISTS (SELECT 1 FROM qiita.qiita_user)"))
+        self.assertFalse(validate_where(
+            "s.study_id IN (SELECT study_id FROM qiita.study_portal)"))
+
+
+class TestValidateWhereRegexFallback(ValidateWhereMixin, TestCase):
+    """The coarse check used when pglast is not installed"""
+
+    def setUp(self):
+        patcher = mock.patch.object(where_validator, 'pglast', None)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_separators_and_comments_rejected(self):
+        self.assertFalse(validate_where("1=1; DROP TABLE qiita.study"))
+        self.assertFalse(validate_where("s.study_id = %s -- comment"))
+        self.assertFalse(validate_where("s.study_id = %s /* comment */"))
+
+
+@skipIf(where_validator.pglast is None, "pglast not installed")
+class TestValidateWherePglast(ValidateWhereMixin, TestCase):
+    """The AST walk used when pglast is available"""
+
+    def test_unparsable_rejected(self):
+        self.assertFalse(validate_where("((("))
+        self.assertFalse(validate_where("s.study_id = %s; SELECT 1"))
+
+
+if __name__ == "__main__":
+    main()
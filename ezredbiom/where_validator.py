@@ -0,0 +1,83 @@
+"""Validation of LLM-generated WHERE fragments.
+
+The natural language study search interpolates the LLM's WHERE clause
+textually into a SELECT, so this module is the boundary that keeps a
+hallucinated (or prompt-injected) fragment from smuggling arbitrary SQL
+into the database. It has no heavy dependencies on purpose, so the
+validation logic can be unit tested without the LLM stack.
+"""
+import json
+import re
+
+# Optional dependency: parses the fragment so every column and table
+# reference can be checked; without it a coarser regex check is used.
+try:
+    import pglast
+except ImportError:
+    pglast = None
+
+# The only (alias, column) pairs an LLM-generated WHERE clause may touch
+ALLOWED_COLUMNS = {
+    ('s', 'study_id'), ('s', 'study_title'), ('s', 'study_abstract'),
+    ('sp_pi', 'name'), ('sp_pi', 'email'), ('sp_pi', 'affiliation'),
+    ('sp_lab', 'name'), ('v', 'visibility'),
+}
+
+_COLUMN_REF = re.compile(r'\b([A-Za-z_]\w*)\.([A-Za-z_]\w*)')
+_SELECT_KEYWORD = re.compile(r'\bselect\b', re.I)
+
+
+def validate_where(clause):
+    """Check that a WHERE fragment only references whitelisted columns
+
+    With pglast available the fragment is actually parsed: every
+    ColumnRef must be in the allowlist and any RangeVar (a table
+    reference, i.e. a subquery reaching into another table) is rejected.
+    Otherwise a regex scan over alias.column references plus a ban on
+    statement separators, comments and SELECT keywords has to do.
+
+    Parameters
+    ----------
+    clause : str
+        WHERE fragment with %s placeholders
+
+    Returns
+    -------
+    bool
+        Whether the clause is safe to interpolate
+    """
+    if pglast is None:
+        if ';' in clause or '--' in clause or '/*' in clause:
+            return False
+        # a subquery is the only way to reach another table without an
+        # alias.column reference; no SELECT keyword means no subquery
+        if _SELECT_KEYWORD.search(clause):
+            return False
+        return all(ref in ALLOWED_COLUMNS
+                   for ref in _COLUMN_REF.findall(clause))
+
+    # %s placeholders are psycopg syntax, not SQL; NULL parses the same
+    try:
+        tree = json.loads(pglast.parser.parse_sql_json(
+            "SELECT 1 WHERE " + clause.replace('%s', 'NULL')))
+    except pglast.Error:
+        return False
+
+    stack = [tree]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, dict):
+            # any table reference means a subquery into another table
+            if 'RangeVar' in node:
+                return False
+            if 'ColumnRef' in node:
+                names = tuple(
+                    f['String'].get('sval', f['String'].get('str'))
+                    for f in node['ColumnRef'].get('fields', [])
+                    if 'String' in f)
+                if names not in ALLOWED_COLUMNS:
+                    return False
+            stack.extend(node.values())
+        elif isinstance(node, list):
+            stack.extend(node)
+    return True
@@ -65,6 +65,7 @@ class Study(qdb.base.QiitaObject):
     processed_data
     add_pmid
     exists
+    get_summary
     has_access
     share
     unshare
@@ -300,6 +301,85 @@ class Study(qdb.base.QiitaObject):
 
             return res
 
+    @classmethod
+    def get_summary(cls, study_id):
+        """Returns the summary information of a study in a single query
+
+        Collects title, alias, abstract, description, inferred status,
+        publications and the PI/lab person contacts in one round trip,
+        for callers that would otherwise pay a query per property access.
+
+        Parameters
+        ----------
+        study_id : int
+            The study id
+
+        Returns
+        -------
+        dict
+            Keys: study_id, study_title, study_alias, study_abstract,
+            study_description, status, publication_doi, publication_pid,
+            principal_investigator and lab_person; the two person values
+            are dicts with name, email and affiliation, or None when the
+            study has no such contact
+
+        Raises
+        ------
+        QiitaDBUnknownIDError
+            If study_id does not exist
+        """
+        with qdb.sql_connection.TRN:
+            sql = """SELECT s.study_id, s.study_title, s.study_alias,
+                            s.study_abstract, s.study_description,
+                            sp_pi.name, sp_pi.email, sp_pi.affiliation,
+                            sp_lab.name, sp_lab.email, sp_lab.affiliation,
+                            (SELECT array_agg(DISTINCT visibility)
+                             FROM qiita.visibility
+                                JOIN qiita.artifact USING (visibility_id)
+                                JOIN qiita.study_artifact USING (artifact_id)
+                             WHERE study_id = s.study_id
+                                AND visibility_id NOT IN %s),
+                            (SELECT array_agg(publication)
+                             FROM qiita.study_publication
+                             WHERE study_id = s.study_id AND is_doi),
+                            (SELECT array_agg(publication)
+                             FROM qiita.study_publication
+                             WHERE study_id = s.study_id AND NOT is_doi)
+                     FROM qiita.study s
+                     LEFT JOIN qiita.study_person sp_pi
+                        ON s.principal_investigator_id = sp_pi.study_person_id
+                     LEFT JOIN qiita.study_person sp_lab
+                        ON s.lab_person_id = sp_lab.study_person_id
+                     WHERE s.study_id = %s"""
+            qdb.sql_connection.TRN.add(
+                sql, [qdb.util.artifact_visibilities_to_skip(), study_id]
+            )
+            rows = qdb.sql_connection.TRN.execute_fetchindex()
+
+        if not rows:
+            raise qdb.exceptions.QiitaDBUnknownIDError(study_id, cls._table)
+
+        (sid, title, alias, abstract, description, pi_name, pi_email, pi_aff,
+         lab_name, lab_email, lab_aff, visibilities, dois, pids) = rows[0]
+
+        def _person(name, email, affiliation):
+            if name is None and email is None:
+                return None
+            return {"name": name, "email": email, "affiliation": affiliation}
+
+        return {
+            "study_id": sid,
+            "study_title": title,
+            "study_alias": alias,
+            "study_abstract": abstract,
+            "study_description": description,
+            "status": qdb.util.infer_status([[v] for v in visibilities or []]),
+            "publication_doi": dois or [],
+            "publication_pid": pids or [],
+            "principal_investigator": _person(pi_name, pi_email, pi_aff),
+            "lab_person": _person(lab_name, lab_email, lab_aff),
+        }
+
     @classmethod
     def exists(cls, study_title):
         """Check if a study exists based on study_title, which is unique
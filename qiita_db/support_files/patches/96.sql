@@ -0,0 +1,8 @@
+-- Aug 28, 2026
+-- Adding a GIN full text search index on study title + abstract so topical
+-- study searches can use tsvector @@ plainto_tsquery instead of ILIKE '%kw%',
+-- which forces a sequential scan
+
+CREATE INDEX study_fts_idx ON qiita.study USING gin(
+    to_tsvector('english',
+                coalesce(study_title, '') || ' ' || coalesce(study_abstract, '')));
@@ -0,0 +1,11 @@
+-- Aug 28, 2026
+-- Adding functional indexes on lower(name) for qiita.study_person so
+-- name-based study searches can use index scans: a trigram GIN index for
+-- substring matches (lower(name) LIKE lower('%val%')) and a B-tree for
+-- exact matches (lower(name) = lower(val))
+
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+CREATE INDEX study_person_name_trgm_idx ON qiita.study_person
+    USING gin (lower(name) gin_trgm_ops);
+CREATE INDEX study_person_name_lower_idx ON qiita.study_person (lower(name));
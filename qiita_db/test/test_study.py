@@ -343,6 +343,42 @@ class TestStudy(TestCase):
         with self.assertRaises(qdb.exceptions.QiitaDBError):
             qdb.study.Study.get_info([1])
 
+    def test_get_summary(self):
+        obs = qdb.study.Study.get_summary(1)
+
+        # the single-query summary must agree with the per-property path
+        self.assertEqual(obs["study_id"], 1)
+        self.assertEqual(obs["study_title"], self.study.title)
+        self.assertEqual(obs["status"], self.study.status)
+
+        info = self.study.info
+        self.assertEqual(obs["study_alias"], info["study_alias"])
+        self.assertEqual(obs["study_abstract"], info["study_abstract"])
+        self.assertEqual(obs["study_description"], info["study_description"])
+
+        pi = info["principal_investigator"]
+        self.assertEqual(
+            obs["principal_investigator"],
+            {"name": pi.name, "email": pi.email, "affiliation": pi.affiliation},
+        )
+        lab = info["lab_person"]
+        self.assertEqual(
+            obs["lab_person"],
+            {"name": lab.name, "email": lab.email, "affiliation": lab.affiliation},
+        )
+
+        pubs = self.study.publications
+        self.assertCountEqual(
+            obs["publication_doi"], [p for p, is_doi in pubs if is_doi]
+        )
+        self.assertCountEqual(
+            obs["publication_pid"], [p for p, is_doi in pubs if not is_doi]
+        )
+
+    def test_get_summary_unknown_id(self):
+        with self.assertRaises(qdb.exceptions.QiitaDBUnknownIDError):
+            qdb.study.Study.get_summary(400000)
+
     def test_has_access_public(self):
         self._change_processed_data_status("public")
 
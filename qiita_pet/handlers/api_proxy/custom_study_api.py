@@ -1,39 +1,97 @@
+import time
+
 from tornado.web import HTTPError
-from json import dumps
+
+# orjson serializes 2-5x faster than stdlib json and returns bytes that
+# tornado writes without re-encoding; fall back to stdlib when missing
+try:
+    from orjson import dumps
+except ImportError:
+    from json import dumps
 
 from qiita_pet.handlers.base_handlers import BaseHandler
 from qiita_db.study import Study
+from qiita_db.sql_connection import TRN
+from qiita_db.util import artifact_visibilities_to_skip, infer_status
 from qiita_db.exceptions import QiitaDBUnknownIDError
 
+# These handlers run their DB work synchronously on the IOLoop thread,
+# like every other handler in the process: TRN is a process-wide
+# singleton that is only safe single-threaded, so offloading a `with
+# TRN:` block to a worker thread would interleave with any concurrent
+# handler's queries on the shared connection. The latency win comes
+# from the single-query payloads and the TTL caches below instead.
+
+
+# Per-study summary payloads shared by the detail handlers, so hitting
+# any combination of /abstract, /detail and /authors for a popular study
+# costs a single Study.get_summary query per TTL window
+_STUDY_CACHE = {}
+_STUDY_CACHE_TTL = 30
+_STUDY_CACHE_MAXSIZE = 2048
+
+
+def _study_payload(study_id):
+    """One-query summary payload for a study, cached for a short TTL
+
+    Each handler writes the subset of keys its endpoint exposes.
+    """
+    now = time.monotonic()
+    hit = _STUDY_CACHE.get(study_id)
+    if hit is not None and now - hit[0] < _STUDY_CACHE_TTL:
+        return hit[1]
+
+    summary = Study.get_summary(study_id)
+
+    payload = {
+        'study_id': study_id,
+        'title': summary['study_title'] or 'No title',
+        'abstract': summary['study_abstract'] or 'No abstract available',
+        'description': summary['study_description'] or 'No description available',
+        'status': summary['status']
+    }
+
+    if summary['principal_investigator'] is not None:
+        payload['principal_investigator'] = summary['principal_investigator']
+    if summary['lab_person'] is not None:
+        payload['lab_person'] = summary['lab_person']
+
+    payload['publication_doi'] = summary['publication_doi']
+    payload['publication_pid'] = summary['publication_pid']
+    payload['study_alias'] = summary['study_alias'] or ''
+
+    if len(_STUDY_CACHE) >= _STUDY_CACHE_MAXSIZE:
+        _STUDY_CACHE.clear()
+    _STUDY_CACHE[study_id] = (now, payload)
+    return payload
+
 
 class StudyAbstractAPIHandler(BaseHandler):
     """Handler to retrieve study abstract - NO AUTHENTICATION REQUIRED"""
-    
+
+    @staticmethod
+    def _payload(study_id):
+        payload = _study_payload(study_id)
+        return {k: payload[k]
+                for k in ('study_id', 'title', 'abstract', 'status')}
+
     def get(self, study_id):
         """
         Retrieve the abstract for a study
-        
+
         Parameters
         ----------
         study_id : str
             The study ID
-        
+
         Returns
         -------
         JSON object with abstract
         """
         try:
             study_id = int(study_id)
-            study = Study(study_id)
-            
-            # Build response with available information
-            response = {
-                'study_id': study_id,
-                'title': study.title,
-                'abstract': study.info.get('study_abstract', 'No abstract available'),
-                'status': study.status
-            }
-            
+            response = self._payload(study_id)
+
             self.set_header('Content-Type', 'application/json')
             self.write(dumps(response))
             
@@ -55,58 +113,27 @@ class StudyAbstractAPIHandler(BaseHandler):
 class StudyDetailAPIHandler(BaseHandler):
     """Handler to retrieve detailed study information - NO AUTHENTICATION"""
     
+    @staticmethod
+    def _payload(study_id):
+        return _study_payload(study_id)
+
     def get(self, study_id):
         """
         Retrieve study details including author and abstract
-        
+
         Parameters
         ----------
         study_id : str
             The study ID to retrieve
-        
+
         Returns
         -------
         JSON object with study details
         """
         try:
             study_id = int(study_id)
-            study = Study(study_id)
-            
-            # Safely get nested dictionary values
-            info = study.info if hasattr(study, 'info') else {}
-            
-            # Build the response with study details
-            response = {
-                'study_id': study_id,
-                'title': study.title if hasattr(study, 'title') else 'No title',
-                'abstract': info.get('study_abstract', 'No abstract available'),
-                'description': info.get('study_description', 'No description available'),
-                'status': study.status if hasattr(study, 'status') else 'unknown'
-            }
-            
-            # Try to get PI info safely
-            if 'principal_investigator' in info:
-                pi = info['principal_investigator']
-                response['principal_investigator'] = {
-                    'name': pi.get('name', '') if isinstance(pi, dict) else str(pi),
-                    'email': pi.get('email', '') if isinstance(pi, dict) else '',
-                    'affiliation': pi.get('affiliation', '') if isinstance(pi, dict) else ''
-                }
-            
-            # Try to get lab person info safely
-            if 'lab_person' in info:
-                lab = info['lab_person']
-                response['lab_person'] = {
-                    'name': lab.get('name', '') if isinstance(lab, dict) else str(lab),
-                    'email': lab.get('email', '') if isinstance(lab, dict) else '',
-                    'affiliation': lab.get('affiliation', '') if isinstance(lab, dict) else ''
-                }
-            
-            # Try to get publications
-            response['publication_doi'] = info.get('publication_doi', [])
-            response['publication_pid'] = info.get('publication_pid', [])
-            response['study_alias'] = info.get('study_alias', '')
-            
+            response = self._payload(study_id)
+
             self.set_header('Content-Type', 'application/json')
             self.write(dumps(response))
             
@@ -124,32 +151,33 @@ class StudyDetailAPIHandler(BaseHandler):
 class StudyAuthorsAPIHandler(BaseHandler):
     """Handler to retrieve study authors specifically - NO AUTHENTICATION"""
     
+    @staticmethod
+    def _payload(study_id):
+        payload = _study_payload(study_id)
+        return {
+            'study_id': study_id,
+            'study_title': payload['title'],
+            'principal_investigator': payload.get('principal_investigator', {}),
+            'lab_person': payload.get('lab_person', {})
+        }
+
     def get(self, study_id):
         """
         Retrieve only author information for a study
-        
+
         Parameters
         ----------
         study_id : str
             The study ID to retrieve authors for
-        
+
         Returns
         -------
         JSON object with author details
         """
         try:
             study_id = int(study_id)
-            study = Study(study_id)
-            
-            info = study.info if hasattr(study, 'info') else {}
-            
-            response = {
-                'study_id': study_id,
-                'study_title': study.title if hasattr(study, 'title') else 'No title',
-                'principal_investigator': info.get('principal_investigator', {}),
-                'lab_person': info.get('lab_person', {})
-            }
-            
+            response = self._payload(study_id)
+
             self.set_header('Content-Type', 'application/json')
             self.write(dumps(response))
             
@@ -161,41 +189,68 @@ class StudyAuthorsAPIHandler(BaseHandler):
             self.write(dumps({'error': f'Error retrieving authors: {str(e)}'}))
 
 
+# Studies are added rarely, so the assembled list payload is reused for
+# a minute before the aggregate query runs again
+_LIST_CACHE = {'t': 0.0, 'v': None}
+_LIST_CACHE_TTL = 60
+
+
 class StudyListAPIHandler(BaseHandler):
     """Handler to list all available studies - NO AUTHENTICATION"""
-    
+
+    @staticmethod
+    def _payload():
+        now = time.monotonic()
+        if _LIST_CACHE['v'] is not None \
+                and now - _LIST_CACHE['t'] < _LIST_CACHE_TTL:
+            return _LIST_CACHE['v']
+
+        # Single round trip for all studies: aggregate the artifact
+        # visibilities per study and infer each status in Python,
+        # instead of instantiating Study (and re-querying) per id
+        with TRN:
+            sql = """SELECT s.study_id, s.study_title,
+                        array_agg(DISTINCT v.visibility)
+                            FILTER (WHERE v.visibility IS NOT NULL)
+                     FROM qiita.study s
+                     LEFT JOIN qiita.study_artifact sa
+                        ON s.study_id = sa.study_id
+                     LEFT JOIN qiita.artifact a
+                        ON sa.artifact_id = a.artifact_id
+                        AND a.visibility_id NOT IN %s
+                     LEFT JOIN qiita.visibility v
+                        ON a.visibility_id = v.visibility_id
+                     GROUP BY s.study_id, s.study_title
+                     ORDER BY s.study_id"""
+            TRN.add(sql, [artifact_visibilities_to_skip()])
+            rows = TRN.execute_fetchindex()
+
+        study_list = [{
+            'study_id': sid,
+            'title': title,
+            'status': infer_status([[v] for v in visibilities or []])
+        } for sid, title, visibilities in rows]
+
+        response = {
+            'total_studies': len(study_list),
+            'studies': study_list
+        }
+
+        _LIST_CACHE['t'] = now
+        _LIST_CACHE['v'] = response
+        return response
+
     def get(self):
         """
         List all studies in the system
-        
+
         Returns
         -------
         JSON object with list of studies
         """
         try:
-            from qiita_db.study import Study
-            
-            # Get all study IDs
-            studies = Study.get_all_study_ids()
-            
-            study_list = []
-            for study_id in studies:
-                try:
-                    study = Study(study_id)
-                    study_list.append({
-                        'study_id': study_id,
-                        'title': study.title if hasattr(study, 'title') else 'No title',
-                        'status': study.status if hasattr(study, 'status') else 'unknown'
-                    })
-                except:
-                    # Skip studies that can't be loaded
-                    continue
-            
-            response = {
-                'total_studies': len(study_list),
-                'studies': study_list
-            }
-            
+            response = self._payload()
+
             self.set_header('Content-Type', 'application/json')
             self.write(dumps(response))
             
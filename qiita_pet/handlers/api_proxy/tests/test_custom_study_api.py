@@ -0,0 +1,118 @@
+# -----------------------------------------------------------------------------
+# Copyright (c) 2014--, The Qiita Development Team.
+#
+# Distributed under the terms of the BSD 3-clause License.
+#
+# The full license is in the file LICENSE, distributed with this software.
+# -----------------------------------------------------------------------------
+from unittest import TestCase, main
+
+import qiita_db as qdb
+from qiita_core.util import qiita_test_checker
+from qiita_pet.handlers.api_proxy import custom_study_api
+from qiita_pet.handlers.api_proxy.custom_study_api import (
+    StudyAbstractAPIHandler,
+    StudyAuthorsAPIHandler,
+    StudyDetailAPIHandler,
+    StudyListAPIHandler,
+    _study_payload,
+)
+
+
+@qiita_test_checker()
+class TestCustomStudyAPI(TestCase):
+    def setUp(self):
+        # the payload caches survive across tests; start each one cold
+        custom_study_api._STUDY_CACHE.clear()
+        custom_study_api._LIST_CACHE["t"] = 0.0
+        custom_study_api._LIST_CACHE["v"] = None
+
+        self.study = qdb.study.Study(1)
+
+    def test_study_payload(self):
+        obs = _study_payload(1)
+
+        self.assertEqual(obs["study_id"], 1)
+        self.assertEqual(obs["title"], self.study.title)
+        self.assertEqual(obs["status"], self.study.status)
+
+        info = self.study.info
+        self.assertEqual(obs["abstract"], info["study_abstract"])
+        self.assertEqual(obs["description"], info["study_description"])
+        self.assertEqual(obs["study_alias"], info["study_alias"])
+
+        pi = info["principal_investigator"]
+        self.assertEqual(
+            obs["principal_investigator"],
+            {"name": pi.name, "email": pi.email, "affiliation": pi.affiliation},
+        )
+
+        pubs = self.study.publications
+        self.assertCountEqual(
+            obs["publication_doi"], [p for p, is_doi in pubs if is_doi]
+        )
+        self.assertCountEqual(
+            obs["publication_pid"], [p for p, is_doi in pubs if not is_doi]
+        )
+
+    def test_study_payload_cached(self):
+        # within the TTL the same payload object is handed back
+        self.assertIs(_study_payload(1), _study_payload(1))
+
+    def test_study_payload_unknown_id(self):
+        with self.assertRaises(qdb.exceptions.QiitaDBUnknownIDError):
+            _study_payload(400000)
+
+    def test_abstract_payload(self):
+        obs = StudyAbstractAPIHandler._payload(1)
+        self.assertCountEqual(
+            obs.keys(), ["study_id", "title", "abstract", "status"]
+        )
+        self.assertEqual(obs["study_id"], 1)
+        self.assertEqual(obs["title"], self.study.title)
+        self.assertEqual(obs["abstract"], self.study.info["study_abstract"])
+
+    def test_detail_payload(self):
+        obs = StudyDetailAPIHandler._payload(1)
+        self.assertEqual(obs, _study_payload(1))
+
+    def test_authors_payload(self):
+        obs = StudyAuthorsAPIHandler._payload(1)
+
+        pi = self.study.info["principal_investigator"]
+        self.assertEqual(
+            obs,
+            {
+                "study_id": 1,
+                "study_title": self.study.title,
+                "principal_investigator": {
+                    "name": pi.name,
+                    "email": pi.email,
+                    "affiliation": pi.affiliation,
+                },
+                "lab_person": _study_payload(1).get("lab_person", {}),
+            },
+        )
+
+    def test_list_payload(self):
+        obs = StudyListAPIHandler._payload()
+
+        self.assertEqual(obs["total_studies"], len(obs["studies"]))
+        entries = {s["study_id"]: s for s in obs["studies"]}
+        self.assertEqual(
+            entries[1],
+            {
+                "study_id": 1,
+                "title": self.study.title,
+                "status": self.study.status,
+            },
+        )
+
+    def test_list_payload_cached(self):
+        self.assertIs(
+            StudyListAPIHandler._payload(), StudyListAPIHandler._payload()
+        )
+
+
+if __name__ == "__main__":
+    main()